@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import numpy as np
 import pandas as pd
 
 from ..ecg import ecg_process
@@ -128,7 +129,7 @@ def bio_process(
 
     """
     bio_info = {}
-    bio_df = pd.DataFrame({})
+    bio_frames = []  # Concatenated once at the end
 
     # Error check if first argument is a Dataframe.
     if ecg is not None:
@@ -167,47 +168,23 @@ def bio_process(
             else:
                 keep = None
 
-    # ECG
-    if ecg is not None:
-        ecg = as_vector(ecg)
-        ecg_signals, ecg_info = ecg_process(ecg, sampling_rate=sampling_rate)
-        bio_info.update(ecg_info)
-        bio_df = pd.concat([bio_df, ecg_signals], axis=1)
-
-    # RSP
-    if rsp is not None:
-        rsp = as_vector(rsp)
-        rsp_signals, rsp_info = rsp_process(rsp, sampling_rate=sampling_rate)
-        bio_info.update(rsp_info)
-        bio_df = pd.concat([bio_df, rsp_signals], axis=1)
-
-    # EDA
-    if eda is not None:
-        eda = as_vector(eda)
-        eda_signals, eda_info = eda_process(eda, sampling_rate=sampling_rate)
-        bio_info.update(eda_info)
-        bio_df = pd.concat([bio_df, eda_signals], axis=1)
-
-    # EMG
-    if emg is not None:
-        emg = as_vector(emg)
-        emg_signals, emg_info = emg_process(emg, sampling_rate=sampling_rate)
-        bio_info.update(emg_info)
-        bio_df = pd.concat([bio_df, emg_signals], axis=1)
-
-    # PPG
-    if ppg is not None:
-        ppg = as_vector(ppg)
-        ppg_signals, ppg_info = ppg_process(ppg, sampling_rate=sampling_rate)
-        bio_info.update(ppg_info)
-        bio_df = pd.concat([bio_df, ppg_signals], axis=1)
-
-    # EOG
-    if eog is not None:
-        eog = as_vector(eog)
-        eog_signals, eog_info = eog_process(eog, sampling_rate=sampling_rate)
-        bio_info.update(eog_info)
-        bio_df = pd.concat([bio_df, eog_signals], axis=1)
+    # Process each modality
+    modalities = [
+        ("ECG", ecg, ecg_process),
+        ("RSP", rsp, rsp_process),
+        ("EDA", eda, eda_process),
+        ("EMG", emg, emg_process),
+        ("PPG", ppg, ppg_process),
+        ("EOG", eog, eog_process),
+    ]
+    processed = {}
+    for name, signal, process in modalities:
+        if signal is None:
+            continue
+        signals, info = process(_bio_process_vector(signal), sampling_rate=sampling_rate)
+        processed[name] = signals
+        bio_info.update(info)
+        bio_frames.append(signals)
 
     # Additional channels to keep
     if keep is not None:
@@ -216,20 +193,35 @@ def bio_process(
         else:
             raise ValueError("The 'keep' argument must be a DataFrame or Series.")
 
-        bio_df = pd.concat([bio_df, keep], axis=1)
+        bio_frames.append(keep)
 
     # RSA
     if ecg is not None and rsp is not None:
         rsa = hrv_rsa(
-            ecg_signals,
-            rsp_signals,
+            processed["ECG"],
+            processed["RSP"],
             rpeaks=None,
             sampling_rate=sampling_rate,
             continuous=True,
         )
-        bio_df = pd.concat([bio_df, rsa], axis=1)
+        bio_frames.append(rsa)
+
+    if len(bio_frames) > 0:
+        bio_df = pd.concat(bio_frames, axis=1)
+    else:
+        bio_df = pd.DataFrame({})
 
     # Add sampling rate in dict info
     bio_info["sampling_rate"] = sampling_rate
 
     return bio_df, bio_info
+
+
+# =============================================================================
+# Internals
+# =============================================================================
+def _bio_process_vector(x):
+    """Skip the conversion (and copy) of as_vector() if x already is a 1D float64 array."""
+    if isinstance(x, np.ndarray) and x.ndim == 1 and x.dtype == np.float64 and x.flags.c_contiguous:
+        return x
+    return as_vector(x)
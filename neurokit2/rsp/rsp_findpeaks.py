@@ -75,25 +75,21 @@ def rsp_findpeaks(
             except NameError:
                 rsp_cleaned = rsp_cleaned["RSP"]
 
-    cleaned = np.array(rsp_cleaned)
+    cleaned = np.ascontiguousarray(rsp_cleaned, dtype=np.float64)
 
     # Find peaks
     method = method.lower()  # remove capitalised letters
-    if method in ["khodadad", "khodadad2018"]:
-        info = _rsp_findpeaks_khodadad(cleaned, amplitude_min=amplitude_min)
-    elif method == "biosppy":
-        info = _rsp_findpeaks_biosppy(cleaned, sampling_rate=sampling_rate)
-    elif method == "scipy":
-        info = _rsp_findpeaks_scipy(
-            cleaned,
-            sampling_rate=sampling_rate,
-            peak_distance=peak_distance,
-            peak_prominence=peak_prominence,
-        )
-    else:
+    if method not in _rsp_findpeaks_methods:
         raise ValueError(
             "NeuroKit error: rsp_findpeaks(): 'method' should be one of 'khodadad2018', 'scipy' or 'biosppy'."
         )
+    info = _rsp_findpeaks_methods[method](
+        cleaned,
+        sampling_rate=sampling_rate,
+        amplitude_min=amplitude_min,
+        peak_distance=peak_distance,
+        peak_prominence=peak_prominence,
+    )
 
     return info
 
@@ -101,7 +97,7 @@ def rsp_findpeaks(
 # =============================================================================
 # Methods
 # =============================================================================
-def _rsp_findpeaks_biosppy(rsp_cleaned, sampling_rate):
+def _rsp_findpeaks_biosppy(rsp_cleaned, sampling_rate, **kwargs):
     """https://github.com/PIA-Group/BioSPPy/blob/master/biosppy/signals/resp.py"""
 
     extrema = _rsp_findpeaks_extrema(rsp_cleaned)
@@ -120,7 +116,7 @@ def _rsp_findpeaks_biosppy(rsp_cleaned, sampling_rate):
     return info
 
 
-def _rsp_findpeaks_khodadad(rsp_cleaned, amplitude_min=0.3):
+def _rsp_findpeaks_khodadad(rsp_cleaned, amplitude_min=0.3, **kwargs):
     """https://iopscience.iop.org/article/10.1088/1361-6579/aad7e6/meta"""
 
     extrema = _rsp_findpeaks_extrema(rsp_cleaned)
@@ -131,7 +127,9 @@ def _rsp_findpeaks_khodadad(rsp_cleaned, amplitude_min=0.3):
     return info
 
 
-def _rsp_findpeaks_scipy(rsp_cleaned, sampling_rate, peak_distance=0.8, peak_prominence=0.5):
+def _rsp_findpeaks_scipy(
+    rsp_cleaned, sampling_rate, peak_distance=0.8, peak_prominence=0.5, **kwargs
+):
     """https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.find_peaks.html"""
     peak_distance = sampling_rate * peak_distance
     peaks, _ = scipy.signal.find_peaks(
@@ -151,6 +149,15 @@ def _rsp_findpeaks_scipy(rsp_cleaned, sampling_rate, peak_distance=0.8, peak_pro
     return info
 
 
+# Method names (lowercase) and their implementation
+_rsp_findpeaks_methods = {
+    "khodadad": _rsp_findpeaks_khodadad,
+    "khodadad2018": _rsp_findpeaks_khodadad,
+    "biosppy": _rsp_findpeaks_biosppy,
+    "scipy": _rsp_findpeaks_scipy,
+}
+
+
 # =============================================================================
 # Internals
 # =============================================================================
@@ -158,47 +165,41 @@ def _rsp_findpeaks_scipy(rsp_cleaned, sampling_rate, peak_distance=0.8, peak_pro
 
 def _rsp_findpeaks_extrema(rsp_cleaned):
     # Detect zero crossings (note that these are zero crossings in the raw
-    # signal, not in its gradient).
-    greater = rsp_cleaned > 0
-    smaller = rsp_cleaned < 0
-    risex = np.where(np.bitwise_and(smaller[:-1], greater[1:]))[0]
-    fallx = np.where(np.bitwise_and(greater[:-1], smaller[1:]))[0]
-
-    if risex[0] < fallx[0]:
-        startx = "rise"
-    elif fallx[0] < risex[0]:
-        startx = "fall"
-
-    allx = np.concatenate((risex, fallx))
-    allx.sort(kind="mergesort")
+    # signal, not in its gradient): -1 where the signal goes from negative to
+    # non-negative (rising), 1 where it goes from non-negative to negative
+    # (falling). Zeros count as non-negative, and there is no crossing next
+    # to a missing value.
+    crossings = np.diff((rsp_cleaned < 0).view(np.int8))
+    missing = np.isnan(rsp_cleaned)
+    has_missing = np.any(missing)
+    if has_missing:
+        crossings[missing[:-1] | missing[1:]] = 0
+    allx = np.flatnonzero(crossings)
 
     # Find extrema by searching minima between falling zero crossing and
-    # rising zero crossing, and searching maxima between rising zero
-    # crossing and falling zero crossing.
-    extrema = []
-    for i in range(len(allx) - 1):
-
-        # Determine whether to search for minimum or maximum.
-        if startx == "rise":
-            if (i + 1) % 2 != 0:
-                argextreme = np.argmax
-            else:
-                argextreme = np.argmin
-        elif startx == "fall":
-            if (i + 1) % 2 != 0:
-                argextreme = np.argmin
-            else:
-                argextreme = np.argmax
-
-        # Get the two zero crossings between which the extreme will be
-        # searched.
-        beg = allx[i]
-        end = allx[i + 1]
-
-        extreme = argextreme(rsp_cleaned[beg:end])
-        extrema.append(beg + extreme)
-
-    extrema = np.asarray(extrema)
+    # the next zero crossing, and searching maxima between rising zero
+    # crossing and the next zero crossing.
+    if len(allx) < 2:
+        raise ValueError(
+            "NeuroKit error: rsp_findpeaks(): not enough zero crossings in the signal. Make sure"
+            " that it is centered around zero (e.g., cleaned with rsp_clean())."
+        )
+    lengths = np.diff(allx)
+    starts = allx[:-1] - allx[0]
+
+    # Flip the sign of the minima segments, so that all extrema become maxima.
+    signs = np.where(crossings[allx[:-1]] == -1, 1.0, -1.0)
+    segments = rsp_cleaned[allx[0] : allx[-1]] * np.repeat(signs, lengths)
+    # Ignore missing values (each segment starts with a non-missing sample, so it
+    # still has one extreme).
+    if has_missing:
+        segments[missing[allx[0] : allx[-1]]] = -np.inf
+
+    # The extreme of each segment is its first sample equal to the segment's maximum.
+    maxima = np.maximum.reduceat(segments, starts)
+    candidates = np.where(segments == np.repeat(maxima, lengths))[0]
+    extrema = allx[0] + candidates[np.searchsorted(candidates, starts)]
+
     return extrema
 
 
@@ -219,8 +220,10 @@ def _rsp_findpeaks_outliers(rsp_cleaned, extrema, amplitude_min=0.3):
     extdiffs = np.sign(np.diff(amplitudes))
     extdiffs = np.add(extdiffs[0:-1], extdiffs[1:])
     removeext = np.where(extdiffs != 0)[0] + 1
-    extrema = np.delete(extrema, removeext)
-    amplitudes = np.delete(amplitudes, removeext)
+    keep = np.ones(len(extrema), dtype=bool)
+    keep[removeext] = False
+    extrema = extrema[keep]
+    amplitudes = amplitudes[keep]
 
     return extrema, amplitudes
 
@@ -231,10 +234,9 @@ def _rsp_findpeaks_sanitize(extrema, amplitudes):
     # breathing amplitude will be defined as vertical distance between each
     # peak and the preceding trough. Note that this also ensures that the
     # number of peaks and troughs is equal.
-    if amplitudes[0] > amplitudes[1]:
-        extrema = np.delete(extrema, 0)
-    if amplitudes[-1] < amplitudes[-2]:
-        extrema = np.delete(extrema, -1)
+    start = 1 if amplitudes[0] > amplitudes[1] else 0
+    stop = -1 if amplitudes[-1] < amplitudes[-2] else None
+    extrema = extrema[start:stop]
     peaks = extrema[1::2]
     troughs = extrema[0:-1:2]
 
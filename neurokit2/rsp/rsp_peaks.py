@@ -77,6 +77,8 @@ def rsp_peaks(rsp_cleaned, sampling_rate=1000, method="khodadad2018", **kwargs):
     peak_signal = signal_formatpeaks(
         info, desired_length=len(rsp_cleaned), peak_indices=info["RSP_Peaks"]
     )
+    # Peaks and troughs are 0/1 markers, which do not need more than one byte per sample
+    peak_signal = peak_signal.astype({"RSP_Peaks": "int8", "RSP_Troughs": "int8"})
 
     info["sampling_rate"] = sampling_rate  # Add sampling rate in dict info
 
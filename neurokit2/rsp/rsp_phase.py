@@ -63,10 +63,12 @@ def rsp_phase(peaks, troughs=None, desired_length=None):
     inspiration[peaks] = 0.0
     inspiration[troughs] = 1.0
 
-    last_element = np.where(~np.isnan(inspiration))[0][
-        -1
-    ]  # Avoid filling beyond the last peak/trough
-    inspiration[0:last_element] = pd.Series(inspiration).ffill().values[0:last_element]
+    # Forward-fill: index of the last non-missing value at each sample
+    idx = np.where(~np.isnan(inspiration), np.arange(len(inspiration)), 0)
+    np.maximum.accumulate(idx, out=idx)
+
+    last_element = idx[-1]  # Avoid filling beyond the last peak/trough
+    inspiration[0:last_element] = inspiration[idx[0:last_element]]
 
     # Phase Completion
     completion = signal_phase(inspiration, method="percent")
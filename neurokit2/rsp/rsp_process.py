@@ -117,13 +117,14 @@ def rsp_process(
     )
     info["sampling_rate"] = sampling_rate  # Add sampling rate in dict info
 
-    # Get additional parameters
-    phase = rsp_phase(peak_signal, desired_length=len(rsp_signal))
-    amplitude = rsp_amplitude(rsp_cleaned, peak_signal)
+    # Get additional parameters (passing the peak indices rather than peak_signal avoids having to
+    # search the signal for them again)
+    phase = rsp_phase(info, desired_length=len(rsp_signal))
+    amplitude = rsp_amplitude(rsp_cleaned, info)
     rate = signal_rate(
         info["RSP_Troughs"], sampling_rate=sampling_rate, desired_length=len(rsp_signal)
     )
-    symmetry = rsp_symmetry(rsp_cleaned, peak_signal)
+    symmetry = rsp_symmetry(rsp_cleaned, info)
     rvt = rsp_rvt(
         rsp_cleaned,
         method=methods["method_rvt"],
@@ -131,7 +132,7 @@ def rsp_process(
         silent=True,
     )
 
-    # Prepare output
+    # Prepare output (built in one go rather than concatenating DataFrames)
     signals = pd.DataFrame(
         {
             "RSP_Raw": rsp_signal,
@@ -139,9 +140,11 @@ def rsp_process(
             "RSP_Amplitude": amplitude,
             "RSP_Rate": rate,
             "RSP_RVT": rvt,
+            **phase.to_dict("series"),
+            **symmetry.to_dict("series"),
+            **peak_signal.to_dict("series"),
         }
     )
-    signals = pd.concat([signals, phase, symmetry, peak_signal], axis=1)
 
     if report is not None:
         # Generate report containing description and figures of processing
@@ -59,33 +59,34 @@ def _signal_from_indices(indices, desired_length=None, value=1):
     Used in *_findpeaks to transform vectors of peak indices to signal.
 
     """
-    signal = pd.Series(np.zeros(desired_length, dtype=float))
+    signal = np.zeros(desired_length, dtype=float)
 
     if isinstance(indices, list) and (not indices):  # skip empty lists
-        return signal
+        return pd.Series(signal)
     if isinstance(indices, np.ndarray) and (indices.size == 0):  # skip empty arrays
-        return signal
+        return pd.Series(signal)
 
     # Force indices as int
     if isinstance(indices[0], float):
         indices = indices[~np.isnan(indices)].astype(int)
+    indices = np.asarray(indices)
 
     # Appending single value
     if isinstance(value, (int, float)):
         signal[indices] = value
-    # Appending multiple values
+    # Appending multiple values (pairing them with the indices, up to the shortest of the two)
     elif isinstance(value, (np.ndarray, list)):
-        for index, val in zip(indices, value):
-            signal.iloc[index] = val
+        n = min(len(indices), len(value))
+        signal[indices[:n]] = np.asarray(value)[:n]
     else:
         if len(value) != len(indices):
             raise ValueError(
                 "NeuroKit error: _signal_from_indices(): The number of values "
                 "is different from the number of indices."
             )
-        signal[indices] = value
+        signal[indices] = np.asarray(value)
 
-    return signal
+    return pd.Series(signal)
 
 
 def _signal_formatpeaks_sanitize(peaks, key="Peaks"):  # FIXME: private function not used in this module
@@ -178,6 +178,43 @@ def test_rsp_peaks():
         assert info["RSP_Peaks"][-1] > info["RSP_Troughs"][-1]
 
 
+def test_rsp_findpeaks_extrema():
+    from neurokit2.rsp.rsp_findpeaks import _rsp_findpeaks_extrema
+
+    rsp = nk.rsp_simulate(duration=60, sampling_rate=1000, noise=0.1, random_state=42)
+    rsp_cleaned = nk.rsp_clean(rsp, sampling_rate=1000)
+
+    extrema = _rsp_findpeaks_extrema(rsp_cleaned)
+    # Extrema alternate between maxima (above zero) and minima (below zero)
+    assert np.all(np.diff(np.sign(rsp_cleaned[extrema])) != 0)
+
+    # Same results as searching each segment between zero crossings
+    crossings = np.where(np.diff(rsp_cleaned < 0))[0]
+    expected = [
+        beg + (np.argmax if rsp_cleaned[beg + 1] >= 0 else np.argmin)(rsp_cleaned[beg:end])
+        for beg, end in zip(crossings[:-1], crossings[1:])
+    ]
+    assert np.array_equal(extrema, expected)
+
+    # Zeros (including negative zeros) count as non-negative
+    assert np.array_equal(_rsp_findpeaks_extrema(np.array([-1, 0, 1, 0, -1, -2, 1.0])), [2, 4])
+    assert np.array_equal(
+        _rsp_findpeaks_extrema(np.array([-1, 0.0, -0.0, 2, 0.0, -0.0, 1, -1])), [3]
+    )
+    # No zero crossing next to missing values
+    assert np.array_equal(_rsp_findpeaks_extrema(np.array([1, np.nan, -1, 2, -2, 1])), [2, 3])
+    # Missing values within a segment are ignored
+    assert np.array_equal(
+        _rsp_findpeaks_extrema(np.array([1, -1, -2, np.nan, -3, -1, 2, 1, -1])), [4, 6]
+    )
+    assert np.array_equal(_rsp_findpeaks_extrema(np.array([1, -1, np.nan, 1, -1])), [1])
+
+    # Signals without zero crossings
+    for signal in [np.ones(10), np.array([1, 2, 0.0, -0.0, 0.0, -0.0, 3, 1])]:
+        with pytest.raises(ValueError, match="not enough zero crossings"):
+            nk.rsp_findpeaks(signal)
+
+
 def test_rsp_amplitude():
     rsp = nk.rsp_simulate(
         duration=120,